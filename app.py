@@ -1,12 +1,16 @@
 """Main application module"""
 import os
 import logging
-from flask import Flask, request, jsonify
-from flask_cors import CORS
+import orjson
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, generate_latest, multiprocess
+from quart import Quart, request
+from quart_cors import cors
 
 from src.experts import SportsExpert, FoodExpert, AIExpert, SudoStarExpert
 from src.experts.selector import ExpertSelector
-from src.utils.openai_client import init_openai
+from src.utils.cache import RedisCache
+from src.utils.openai_client import init_openai, close_http_client
+from src.utils.web_search import get_session, close_session
 from config.config import EXPERT_CONFIG
 
 # Configure logging
@@ -16,12 +20,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Initialize Flask app
-app = Flask(__name__)
-CORS(app)
+# Initialize Quart app
+app = Quart(__name__)
+app = cors(app)
 
-# Initialize expert system
+def ojsonify(data):
+    """Serialize data to a JSON response with orjson"""
+    return app.response_class(orjson.dumps(data), mimetype='application/json')
+
+# Expert system, built once per worker in startup()
 expert_system = {}
+openai_api_key = None
+initialized = False
 
 def init_app():
     """Initialize application
@@ -50,8 +60,8 @@ def init_app():
                 'sudostar': SudoStarExpert(config=EXPERT_CONFIG['sudostar'])
             }
             logger.info("Experts initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing experts: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing experts")
             return False
         
         # Initialize expert selector
@@ -59,23 +69,37 @@ def init_app():
             logger.info("Initializing expert selector...")
             expert_system['selector'] = ExpertSelector()
             logger.info("Expert selector initialized successfully")
-        except Exception as e:
-            logger.error(f"Error initializing expert selector: {str(e)}")
+        except Exception:
+            logger.exception("Error initializing expert selector")
             return False
         
         logger.info("Expert system initialized successfully")
         return True
         
-    except Exception as e:
-        logger.error(f"Error initializing application: {str(e)}")
+    except Exception:
+        logger.exception("Error initializing application")
         return False
 
+@app.before_serving
+async def startup():
+    """Open the shared HTTP session and build the expert system once per worker"""
+    global initialized
+    get_session()
+    initialized = init_app()
+
+@app.after_serving
+async def shutdown():
+    """Close the shared HTTP session, OpenAI HTTP client and Redis clients"""
+    await close_session()
+    await close_http_client()
+    for expert in expert_system.values():
+        if isinstance(getattr(expert, 'cache', None), RedisCache):
+            await expert.cache.close()
+
 @app.route('/health')
-def health():
-    is_initialized = init_app()
-    
+async def health():
     response = {
-        'status': 'healthy' if is_initialized else 'unhealthy',
+        'status': 'healthy' if initialized else 'unhealthy',
         'services': {
             'api': 'running',
             'openai_api': 'configured' if openai_api_key else 'missing',
@@ -83,36 +107,45 @@ def health():
         }
     }
     
-    if not is_initialized:
+    if not initialized:
         response['error'] = 'System not properly initialized'
     
-    return jsonify(response), 200 if is_initialized else 503
+    return ojsonify(response), 200 if initialized else 503
+
+@app.route('/metrics')
+async def metrics():
+    # Under gunicorn every worker keeps its own counters; aggregate them
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry), 200, {'Content-Type': CONTENT_TYPE_LATEST}
+    return generate_latest(), 200, {'Content-Type': CONTENT_TYPE_LATEST}
 
 @app.route('/', methods=['POST'])
 @app.route('/ask', methods=['POST'])
 async def ask():
-    if not init_app():
-        return jsonify({
+    if not initialized:
+        return ojsonify({
             'status': 'error',
             'error': 'System not properly initialized',
             'code': 'INIT_ERROR'
         }), 503
 
     try:
-        data = request.get_json()
+        data = await request.get_json()
         if not data or 'question' not in data:
-            return jsonify({
+            return ojsonify({
                 'status': 'error',
                 'error': 'Question is required',
                 'code': 'MISSING_QUESTION'
             }), 400
 
         question = data['question']
-        logger.info(f"Received question: {question}")
+        logger.info("Received question: %s", question)
         
         # Select expert and get response
         expert_type, direct_response = await expert_system['selector'].select_expert(question)
-        logger.info(f"Selected expert: {expert_type}")
+        logger.info("Selected expert: %s", expert_type)
         
         response = None
         if expert_type and expert_type in expert_system:
@@ -121,14 +154,14 @@ async def ask():
             response = direct_response
 
         if not response:
-            return jsonify({
+            return ojsonify({
                 'status': 'error',
                 'error': 'Could not generate response',
                 'code': 'NO_RESPONSE'
             }), 500
 
-        logger.info(f"Generated response for {expert_type} expert")
-        return jsonify({
+        logger.info("Generated response for %s expert", expert_type)
+        return ojsonify({
             'status': 'success',
             'data': {
                 'answer': response,
@@ -137,14 +170,16 @@ async def ask():
         })
 
     except Exception as e:
-        logger.error(f"Error in /ask endpoint: {str(e)}")
-        return jsonify({
+        logger.exception("Error in /ask endpoint")
+        return ojsonify({
             'status': 'error',
             'error': str(e),
             'code': 'INTERNAL_ERROR'
         }), 500
 
 if __name__ == '__main__':
+    import uvicorn
+
     port = int(os.environ.get('PORT', 8080))  # Railway uses port 8080
-    logger.info(f"Starting Flask app on port {port}")
-    app.run(host='0.0.0.0', port=port) 
\ No newline at end of file
+    logger.info("Starting Quart app on port %s", port)
+    uvicorn.run(app, host='0.0.0.0', port=port)
@@ -26,6 +26,11 @@ TAVILY_CONFIG = {
     "API_KEY": os.getenv("TAVILY_API_KEY")
 }
 
+# Redis Configuration
+REDIS_CONFIG = {
+    "URL": os.getenv("REDIS_URL", "redis://localhost:6379/0")
+}
+
 # Application Settings
 APP_CONFIG = {
     'daily_tweet_limit': 50,
@@ -0,0 +1,28 @@
+"""Gunicorn configuration
+
+Quart is an ASGI app, so workers use uvicorn's asyncio worker class
+instead of gevent: every /ask request awaits OpenAI and web search on
+the worker's event loop, and many of them overlap per worker.
+"""
+import multiprocessing
+import os
+import tempfile
+
+# Workers write prometheus metrics to this directory so /metrics can
+# aggregate them; it must be set before prometheus_client is imported.
+if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+    os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='prometheus_')
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8080)}"  # Railway uses port 8080
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'uvicorn.workers.UvicornWorker'
+
+# Import the app (config, knowledge base indexes) once in the master so
+# workers share those pages copy-on-write; experts are built per worker
+# in the app's before_serving hook.
+preload_app = True
+
+def child_exit(server, worker):
+    """Drop the exited worker's live prometheus metrics"""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
@@ -2,6 +2,7 @@
 import logging
 from typing import Optional
 
+from src.utils.cache import Cache
 from src.utils.openai_client import OpenAIClient
 from src.utils.web_search import WebSearchClient
 
@@ -10,8 +11,18 @@ logger = logging.getLogger(__name__)
 class BaseExpert:
     """Base expert class"""
     
-    def __init__(self):
-        """Initialize base expert"""
+    def __init__(self, config: Optional[dict] = None):
+        """Initialize base expert
+        
+        Args:
+            config (Optional[dict]): Expert configuration
+        """
+        self.config = config or {}
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.cache = Cache(
+            enabled=self.config.get('cache_enabled', True),
+            ttl=self.config.get('cache_ttl', 3600)
+        )
         self.openai_client = OpenAIClient()
         self.web_search = WebSearchClient()
         
@@ -1,9 +1,100 @@
 """Sports expert module"""
+import asyncio
 import logging
-from typing import Optional
+import orjson
+from typing import Awaitable, Callable, Dict, Optional
 from src.experts.base_expert import BaseExpert
+from src.utils.cache import RedisCache
 from src.utils.event_bus import EventBus
+from config.config import REDIS_CONFIG
+from .sources.local_data import find_answer
+from .sources.url_sources import search_url_sources
 
+# How long a faster, lower-priority source may wait for a higher-priority one
+SOURCE_GRACE_PERIOD = 0.5
+
+# Web search only starts once the AI stage has failed or taken this many seconds
+WEB_HEDGE_DELAY = 4.0
+
+# A refreshed answer shorter than this fraction of the cached one is discarded
+REFRESH_MIN_LENGTH_RATIO = 0.8
+
+# Default per-source time limits in seconds, overridable via config['stage_timeouts']
+STAGE_TIMEOUTS = {
+    'local': 2,
+    'url': 3,
+    'ai': 8,
+    'web': 6
+}
+
+_SYSTEM_PROMPT_AI = """Sen bir spor uzmanısın. Futbol, basketbol, voleybol ve diğer sporlar hakkında detaylı bilgi sahibisin.
+Soruları kısa ve öz bir şekilde yanıtla. Emin olmadığın konularda bunu belirt.
+Yanıtlarında güncel ve doğru bilgiler vermeye özen göster."""
+
+_SYSTEM_PROMPT_WEB = """Sen bir spor uzmanısın.
+Verilen web arama sonuçlarını kullanarak soruya kısa ve doğru bir yanıt üret.
+Emin olmadığın bilgileri verme.
+Ardından yanıtının web arama sonuçları tarafından desteklenip desteklenmediğini değerlendir.
+Yanıtı JSON formatında ver: {"answer": string, "is_valid": boolean, "reason": string}"""
+
+_USER_WEB_TMPL = "Soru: {q}\n\nWeb arama sonuçları:\n{ctx}\n\nBu bilgileri kullanarak soruya yanıt ver."
+
+async def _bounded(coro: Awaitable[Optional[str]], timeout: float) -> Optional[str]:
+    """Await coro, treating a timeout as no answer
+    
+    Args:
+        coro (Awaitable[Optional[str]]): Source coroutine
+        timeout (float): Time limit in seconds
+        
+    Returns:
+        Optional[str]: Result of coro or None if it timed out
+    """
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except asyncio.TimeoutError:
+        return None
+        
+async def _hedged(
+    primary: asyncio.Task,
+    delay: float,
+    fallback: Callable[[], Awaitable[Optional[str]]]
+) -> Optional[str]:
+    """Run fallback only if primary gives no answer within delay seconds
+    
+    Args:
+        primary (asyncio.Task): Higher-priority source task
+        delay (float): Hedge delay in seconds
+        fallback (Callable[[], Awaitable[Optional[str]]]): Factory for the fallback source
+        
+    Returns:
+        Optional[str]: Fallback result, or None if primary answered in time
+    """
+    done, _ = await asyncio.wait({primary}, timeout=delay)
+    if done and not primary.cancelled() and primary.exception() is None and primary.result():
+        return None
+    return await fallback()
+    
+def _parse_json_reply(reply: str) -> dict:
+    """Parse the JSON object in a model reply
+    
+    Without response_format the model may wrap the object in code fences
+    or add text around it, so only the outermost {...} block is parsed.
+    
+    Args:
+        reply (str): Raw model reply
+        
+    Returns:
+        dict: Parsed object
+        
+    Raises:
+        ValueError: If the reply contains no JSON object
+    """
+    start = reply.find('{')
+    end = reply.rfind('}')
+    if start == -1 or end < start:
+        raise ValueError(f"No JSON object in reply: {reply[:100]!r}")
+    return orjson.loads(reply[start:end + 1])
+    
 class SportsExpert(BaseExpert):
     """Expert for handling sports-related queries"""
     
@@ -14,6 +105,14 @@ class SportsExpert(BaseExpert):
             config: Expert configuration
         """
         super().__init__(config)
+        self.cache = RedisCache(
+            url=REDIS_CONFIG['URL'],
+            prefix='sports',
+            enabled=self.config.get('cache_enabled', True),
+            ttl=self.config.get('cache_ttl', 3600)
+        )
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
         self.event_bus = EventBus()
         
         # Subscribe to events
@@ -30,48 +129,223 @@ class SportsExpert(BaseExpert):
             Optional[str]: Generated response or None if failed
         """
         try:
-            # Check cache first
+            # Check cache first, refreshing stale entries in the background
             if self.cache:
-                cached_response = self.cache.get(query)
+                cached_response, age = await self.cache.get_with_meta(query)
                 if cached_response:
+                    if age > self.cache.ttl:
+                        self._schedule_refresh(query, cached_response)
                     return cached_response
                     
-            # Check local knowledge base
-            local_response = await self._check_local_knowledge(query)
-            if local_response:
+            response = await self._coalesced_response(query)
+            if response:
                 if self.cache:
-                    self.cache.set(query, local_response)
-                return local_response
+                    await self.cache.set(query, response)
+                return response
                 
-            # Check URL sources
-            url_response = await self._check_url_sources(query)
-            if url_response:
-                if self.cache:
-                    self.cache.set(query, url_response)
-                return url_response
+            return "Üzgünüm, bu spor sorusuna yanıt üretemiyorum. Lütfen soruyu daha açık bir şekilde sorar mısınız?"
+            
+        except Exception as e:
+            self.logger.error("Error generating sports response: %s", e)
+            return None
+            
+    async def _coalesced_response(self, query: str) -> Optional[str]:
+        """Run the source pipeline, sharing one run among identical concurrent queries
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Optional[str]: Generated response or None if no source answered
+        """
+        key = self.cache.make_key(query)
+        task = self._inflight.get(key)
+        if task is None:
+            # The run is its own task so a cancelled caller can't cancel it
+            task = asyncio.create_task(self._first_response(query))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+        
+    def _schedule_refresh(self, query: str, cached_response: str) -> None:
+        """Refresh a stale cache entry in the background, once per cache key
+        
+        Args:
+            query (str): User query
+            cached_response (str): Stale cached response
+        """
+        key = self.cache.make_key(query)
+        if key in self._refreshing:
+            return
+        task = asyncio.create_task(self._refresh(query, cached_response))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(key, None))
+        
+    async def _refresh(self, query: str, cached_response: str) -> None:
+        """Recompute a stale answer and keep whichever is better
+        
+        The new answer only replaces the cached one if it is not much
+        shorter; otherwise the cached answer is re-stamped as fresh.
+        
+        Args:
+            query (str): User query
+            cached_response (str): Stale cached response
+        """
+        try:
+            response = await self._coalesced_response(query)
+            if response and len(response) >= REFRESH_MIN_LENGTH_RATIO * len(cached_response):
+                await self.cache.set(query, response)
+            else:
+                await self.cache.set(query, cached_response)
+        except Exception as e:
+            self.logger.error("Error refreshing sports response: %s", e)
+            
+    async def _first_response(self, query: str) -> Optional[str]:
+        """Run sources concurrently and return the best available answer
+        
+        The local knowledge base is an in-memory lookup, so it is checked
+        first and a hit returns without calling any remote source. On a
+        miss the remaining sources are listed in priority order. As soon as no higher-priority
+        source is still running, the best answer is returned. A lower-priority
+        answer waits at most SOURCE_GRACE_PERIOD seconds for a better one.
+        Web search is a hedge for the AI stage: it only starts once the AI
+        stage fails or exceeds WEB_HEDGE_DELAY, so it doesn't spend a Tavily
+        query and a second completion on answers that get discarded.
+        Each source is limited by its stage timeout; remaining tasks are
+        cancelled.
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Optional[str]: Best response or None if no source answered
+        """
+        timeouts = {**STAGE_TIMEOUTS, **self.config.get('stage_timeouts', {})}
+        local_response = await _bounded(self._check_local_knowledge(query), timeouts['local'])
+        if local_response:
+            return local_response
+            
+        loop = asyncio.get_running_loop()
+        ai_task = asyncio.create_task(_bounded(self._generate_ai_response(query), timeouts['ai']))
+        tasks = [
+            asyncio.create_task(_bounded(self._check_url_sources(query), timeouts['url'])),
+            ai_task,
+            asyncio.create_task(_hedged(
+                ai_task,
+                self.config.get('web_hedge_delay', WEB_HEDGE_DELAY),
+                lambda: _bounded(self._perform_web_search(query), timeouts['web'])
+            ))
+        ]
+        pending = set(tasks)
+        results = {}
+        deadline = None
+        
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0, deadline - loop.time())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                    
+                for task in done:
+                    if task.cancelled() or task.exception():
+                        continue
+                    if task.result():
+                        results[tasks.index(task)] = task.result()
+                        
+                if results:
+                    best = min(results)
+                    if not any(tasks.index(task) < best for task in pending):
+                        break
+                    if deadline is None:
+                        deadline = loop.time() + SOURCE_GRACE_PERIOD
+                        
+            return results[min(results)] if results else None
+            
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            
+    async def _check_local_knowledge(self, query: str) -> Optional[str]:
+        """Look up query in the local knowledge base
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Optional[str]: Answer if found
+        """
+        try:
+            return find_answer(query)
+        except Exception as e:
+            self.logger.error("Error checking local knowledge: %s", e)
+            return None
+            
+    async def _check_url_sources(self, query: str) -> Optional[str]:
+        """Look up query in configured sports URLs
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Optional[str]: Relevant content if found
+        """
+        try:
+            return await search_url_sources(query)
+        except Exception as e:
+            self.logger.error("Error checking URL sources: %s", e)
+            return None
+            
+    async def _generate_ai_response(self, query: str) -> Optional[str]:
+        """Generate response using OpenAI
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Optional[str]: Generated response
+        """
+        try:
+            return await self.openai_client.get_completion(_SYSTEM_PROMPT_AI, query)
+        except Exception as e:
+            self.logger.error("Error generating AI response: %s", e)
+            return None
+            
+    async def _perform_web_search(self, query: str) -> Optional[str]:
+        """Answer query from web search results
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Optional[str]: Validated response built from search results
+        """
+        try:
+            search_results = await self.web_search.search(query, k=3)
+            if not search_results:
+                return None
                 
-            # Generate response using OpenAI
-            system_prompt = """Sen bir spor uzmanısın. Futbol, basketbol, voleybol ve diğer sporlar hakkında detaylı bilgi sahibisin.
-            Soruları kısa ve öz bir şekilde yanıtla. Emin olmadığın konularda bunu belirt.
-            Yanıtlarında güncel ve doğru bilgiler vermeye özen göster."""
+            context = "\n".join(search_results)
             
-            ai_response = await self.openai_client.get_completion(system_prompt, query)
-            if ai_response:
-                if self.cache:
-                    self.cache.set(query, ai_response)
-                return ai_response
+            response = await self.openai_client.get_completion(
+                _SYSTEM_PROMPT_WEB,
+                _USER_WEB_TMPL.format(q=query, ctx=context)
+            )
+            if not response:
+                return None
                 
-            # Perform web search as last resort
-            web_response = await self._perform_web_search(query)
-            if web_response:
-                if self.cache:
-                    self.cache.set(query, web_response)
-                return web_response
+            result = _parse_json_reply(response)
+            answer = result.get('answer')
+            if answer and result.get('is_valid'):
+                return answer
                 
-            return "Üzgünüm, bu spor sorusuna yanıt üretemiyorum. Lütfen soruyu daha açık bir şekilde sorar mısınız?"
+            return None
             
         except Exception as e:
-            self.logger.error(f"Error generating sports response: {str(e)}")
+            self.logger.error("Error performing web search: %s", e)
             return None
             
     async def _on_question_received(self, question: str) -> None:
@@ -80,7 +354,7 @@ class SportsExpert(BaseExpert):
         Args:
             question (str): Received question
         """
-        self.logger.info(f"Sports expert received question: {question}")
+        self.logger.info("Sports expert received question: %s", question)
         
     async def _on_response_generated(self, response: str) -> None:
         """Handle generated response event
@@ -88,4 +362,4 @@ class SportsExpert(BaseExpert):
         Args:
             response (str): Generated response
         """
-        self.logger.info(f"Sports expert generated response: {response}") 
\ No newline at end of file
+        self.logger.info("Sports expert generated response: %s", response) 
\ No newline at end of file
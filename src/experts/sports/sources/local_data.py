@@ -49,6 +49,13 @@ def get_common_questions() -> Dict[str, str]:
             "super_lig_champion": "En çok şampiyonluğu olan takım 23 şampiyonlukla Galatasaray'dır."
         }
 
+# Loaded once at import so lookups don't reopen the data files per request
+_KNOWLEDGE_BASE = get_knowledge_base()
+_COMMON_QUESTIONS = get_common_questions()
+
+# (keywords, answer) pairs in file order, for keyword matches
+_KEYWORD_INDEX = [(tuple(q.lower().split("_")), a) for q, a in _COMMON_QUESTIONS.items()]
+
 def find_answer(question: str, knowledge_base: Optional[Dict] = None) -> Optional[str]:
     """Find answer in knowledge base
     
@@ -60,18 +67,16 @@ def find_answer(question: str, knowledge_base: Optional[Dict] = None) -> Optiona
         Optional[str]: Answer if found
     """
     if knowledge_base is None:
-        knowledge_base = get_knowledge_base()
+        knowledge_base = _KNOWLEDGE_BASE
         
+    question = question.lower()
+    
     # Check common questions first
-    common_questions = get_common_questions()
-    for q, a in common_questions.items():
-        if any(word in question.lower() for word in q.lower().split("_")):
+    for keywords, a in _KEYWORD_INDEX:
+        if any(word in question for word in keywords):
             return a
             
-    # Check knowledge base
-    question = question.lower()
-    
-    # Check football teams
+    # Check knowledge base for football teams
     if "football" in knowledge_base:
         teams = knowledge_base["football"]["teams"]
         for team_key, team_data in teams.items():
@@ -4,6 +4,7 @@ import json
 import logging
 import aiohttp
 from typing import Dict, List, Optional
+from src.utils.web_search import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -40,10 +41,9 @@ async def fetch_url_content(url: str) -> Optional[str]:
         Optional[str]: Content if successful
     """
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as response:
-                if response.status == 200:
-                    return await response.text()
+        async with get_session().get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            if response.status == 200:
+                return await response.text()
     except Exception as e:
         logger.error(f"Error fetching URL {url}: {str(e)}")
     return None
@@ -11,9 +11,13 @@ logger = logging.getLogger(__name__)
 class SudoStarExpert(BaseExpert):
     """Expert for SudoStar related questions"""
     
-    def __init__(self):
-        """Initialize SudoStar expert"""
-        super().__init__()
+    def __init__(self, config=None):
+        """Initialize SudoStar expert
+        
+        Args:
+            config: Expert configuration
+        """
+        super().__init__(config)
         self.knowledge_base = get_knowledge_base()
         self.web_search = WebSearchClient()
         
@@ -1,7 +1,7 @@
 """Utility modules"""
 from .config import ConfigLoader
-from .cache import Cache
+from .cache import Cache, RedisCache
 from .logger import setup_logger
 from .openai_client import OpenAIClient
 
-__all__ = ['ConfigLoader', 'Cache', 'setup_logger', 'OpenAIClient'] 
\ No newline at end of file
+__all__ = ['ConfigLoader', 'Cache', 'RedisCache', 'setup_logger', 'OpenAIClient'] 
\ No newline at end of file
@@ -1,6 +1,17 @@
 """Cache utility for storing responses"""
+import asyncio
+import hashlib
+import logging
 import time
-from typing import Dict, Any, Optional
+import weakref
+from typing import Dict, Any, Optional, Tuple
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+CACHE_HITS = Counter('expert_cache_hits_total', 'Response cache hits', ['expert'])
+CACHE_MISSES = Counter('expert_cache_misses_total', 'Response cache misses', ['expert'])
 
 class Cache:
     """Simple in-memory cache with TTL support"""
@@ -77,4 +88,105 @@ class Cache:
             if current_time - data['timestamp'] > self.ttl
         ]
         for key in expired_keys:
-            del self._cache[key] 
\ No newline at end of file
+            del self._cache[key]
+
+
+class RedisCache:
+    """Redis-backed cache shared by every worker process"""
+    
+    def __init__(self, url: str, prefix: str, enabled: bool = True, ttl: int = 3600):
+        """Initialize cache
+        
+        Args:
+            url (str): Redis connection URL
+            prefix (str): Key prefix, usually the expert name
+            enabled (bool, optional): Whether caching is enabled. Defaults to True.
+            ttl (int, optional): Time to live in seconds. Defaults to 3600 (1 hour).
+        """
+        self.enabled = enabled
+        self.ttl = ttl
+        self.prefix = prefix
+        self.url = url
+        # A redis.asyncio client is bound to the loop it first runs on
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Redis]" = weakref.WeakKeyDictionary()
+        
+    def _get_client(self) -> Redis:
+        """Return the running loop's Redis client, creating it on first use
+        
+        Returns:
+            Redis: Client for this cache's URL
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = Redis.from_url(self.url, decode_responses=True)
+            self._clients[loop] = client
+        return client
+        
+    async def close(self) -> None:
+        """Close the running loop's Redis client"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+        
+    def make_key(self, query: str) -> str:
+        """Build cache key from normalized query
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            str: Cache key
+        """
+        normalized = " ".join(query.lower().split())
+        return f"{self.prefix}:{hashlib.sha256(normalized.encode()).hexdigest()}"
+        
+    async def get_with_meta(self, query: str) -> Tuple[Optional[str], float]:
+        """Get value and its age, keeping stale entries for up to twice the TTL
+        
+        Args:
+            query (str): User query
+            
+        Returns:
+            Tuple[Optional[str], float]: Cached value (None if not found) and its age in seconds
+        """
+        if not self.enabled:
+            return None, 0.0
+            
+        # Any failure is a miss: the cache must never cost the answer itself
+        try:
+            cache_data = await self._get_client().hgetall(self.make_key(query))
+            if cache_data:
+                value, age = cache_data['value'], time.time() - float(cache_data['timestamp'])
+        except Exception as e:
+            logger.warning("Redis get failed: %s", e)
+            return None, 0.0
+            
+        if not cache_data:
+            CACHE_MISSES.labels(self.prefix).inc()
+            return None, 0.0
+            
+        CACHE_HITS.labels(self.prefix).inc()
+        return value, age
+        
+    async def set(self, query: str, value: str) -> None:
+        """Set value in cache with current timestamp
+        
+        Entries live for twice the TTL so stale values can be served while
+        they are refreshed.
+        
+        Args:
+            query (str): User query
+            value (str): Value to cache
+        """
+        if not self.enabled:
+            return
+            
+        key = self.make_key(query)
+        try:
+            async with self._get_client().pipeline() as pipe:
+                pipe.hset(key, mapping={'value': value, 'timestamp': time.time()})
+                pipe.expire(key, 2 * self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Redis set failed: %s", e)
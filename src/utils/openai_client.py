@@ -1,10 +1,44 @@
 """OpenAI client module"""
+import asyncio
 import os
 import logging
+import weakref
+from typing import Any, Dict
+import httpx
 from openai import OpenAI, AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 
+# Semaphore, HTTP pool and API clients per event loop. They are shared by
+# all OpenAIClient instances so the caps apply to the whole process, but
+# created lazily because asyncio primitives bind to the loop that uses them.
+_loop_resources: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+
+def _get_loop_resources() -> Dict[str, Any]:
+    """Return the running loop's shared OpenAI resources, creating them on first use
+    
+    Returns:
+        Dict[str, Any]: Semaphore, HTTP client and AsyncOpenAI clients by API key
+    """
+    loop = asyncio.get_running_loop()
+    resources = _loop_resources.get(loop)
+    if resources is None:
+        resources = {
+            'semaphore': asyncio.Semaphore(int(os.getenv('OPENAI_CONCURRENCY', 20))),
+            'http_client': httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            ),
+            'clients': {}
+        }
+        _loop_resources[loop] = resources
+    return resources
+
+async def close_http_client() -> None:
+    """Close the running loop's shared OpenAI HTTP client"""
+    resources = _loop_resources.pop(asyncio.get_running_loop(), None)
+    if resources is not None:
+        await resources['http_client'].aclose()
+
 def init_openai():
     """Initialize OpenAI API key
     
@@ -26,9 +60,25 @@ class OpenAIClient:
         if not self.api_key:
             logger.warning('OpenAI client initialized without API key')
         else:
-            self.client = AsyncOpenAI(api_key=self.api_key)
             logger.info('OpenAI client initialized successfully')
             
+    def _get_client(self) -> AsyncOpenAI:
+        """Return the AsyncOpenAI client for the running loop
+        
+        Returns:
+            AsyncOpenAI: Client using the loop's shared HTTP pool
+        """
+        resources = _get_loop_resources()
+        client = resources['clients'].get(self.api_key)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=resources['http_client'],
+                timeout=float(os.getenv('OPENAI_TIMEOUT', 10))
+            )
+            resources['clients'][self.api_key] = client
+        return client
+            
     async def chat_completion(self, messages: list) -> str:
         """Get chat completion from OpenAI
         
@@ -42,15 +92,32 @@ class OpenAIClient:
             if not self.api_key:
                 return "OpenAI API key not configured"
                 
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                temperature=0.7,
-                max_tokens=500
-            )
+            async with _get_loop_resources()['semaphore']:
+                response = await self._get_client().chat.completions.create(
+                    model="gpt-4",
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=500
+                )
             
             return response.choices[0].message.content
             
         except Exception as e:
             logger.error(f'Error in chat completion: {str(e)}')
-            return None 
\ No newline at end of file
+            return None
+            
+    async def get_completion(self, system_prompt: str, user_prompt: str) -> str:
+        """Get completion for a system prompt and a user prompt
+        
+        Args:
+            system_prompt (str): System instructions
+            user_prompt (str): User message
+            
+        Returns:
+            str: Generated response
+        """
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        return await self.chat_completion(messages)
\ No newline at end of file
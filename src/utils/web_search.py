@@ -1,27 +1,69 @@
 """Web search utility"""
+import asyncio
 import logging
 import os
-from typing import List, Optional, Dict, Any
+import weakref
+from typing import List
 import aiohttp
-from tavily import TavilyClient
 
 logger = logging.getLogger(__name__)
 
+TAVILY_SEARCH_URL = 'https://api.tavily.com/search'
+
+# One session per event loop, shared across all clients so connections and
+# DNS lookups are reused; keyed by loop because a session is bound to the
+# loop it was created on.
+_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = weakref.WeakKeyDictionary()
+
+def get_session() -> aiohttp.ClientSession:
+    """Return the running loop's HTTP session, creating it on first use
+
+    Returns:
+        aiohttp.ClientSession: Shared session with a bounded connection pool
+    """
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(limit=100, limit_per_host=20, ttl_dns_cache=300)
+        session = aiohttp.ClientSession(connector=connector)
+        _sessions[loop] = session
+    return session
+
+async def close_session() -> None:
+    """Close the running loop's HTTP session"""
+    session = _sessions.pop(asyncio.get_running_loop(), None)
+    if session is not None and not session.closed:
+        await session.close()
+
 class WebSearchClient:
     def __init__(self):
         self.api_key = os.getenv('TAVILY_API_KEY')
         if not self.api_key:
             logger.warning('TAVILY_API_KEY not found in environment variables')
         else:
-            self.client = TavilyClient(api_key=self.api_key)
             logger.info('Web search client initialized successfully')
 
-    async def search(self, query: str) -> list:
+    async def search(self, query: str, k: int = 3) -> List[str]:
+        """Search the web and return the content of the top results
+
+        Args:
+            query (str): Search query
+            k (int, optional): Maximum number of results. Defaults to 3.
+
+        Returns:
+            List[str]: Content of at most k results
+        """
         if not self.api_key:
             return []
         try:
-            response = self.client.search(query=query)
-            return response.get('results', [])
+            async with get_session().post(
+                TAVILY_SEARCH_URL,
+                json={'api_key': self.api_key, 'query': query, 'max_results': k},
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+                return [result.get('content', '') for result in data.get('results', [])[:k]]
         except Exception as e:
             logger.error(f'Error in web search: {str(e)}')
-            return [] 
\ No newline at end of file
+            return []
@@ -0,0 +1,26 @@
+import sys
+import os
+import asyncio
+
+# Add src directory to Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.cache import RedisCache
+
+def test_redis_cache_fails_open_across_event_loops():
+    # Nothing listens on port 1, so every call fails and must count as a miss
+    cache = RedisCache(url='redis://127.0.0.1:1/0', prefix='test')
+
+    clients = []
+
+    async def use_cache(close):
+        await cache.set('soru', 'yanıt')
+        result = await cache.get_with_meta('soru')
+        clients.append(cache._get_client())
+        if close:
+            await cache.close()
+        return result
+
+    assert asyncio.run(use_cache(close=False)) == (None, 0.0)
+    assert asyncio.run(use_cache(close=True)) == (None, 0.0)
+    assert clients[0] is not clients[1]
@@ -0,0 +1,27 @@
+import sys
+import os
+import asyncio
+
+# Add src directory to Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils import openai_client
+from src.utils.openai_client import OpenAIClient, close_http_client
+
+def test_resources_are_created_per_event_loop(monkeypatch):
+    monkeypatch.setenv('OPENAI_API_KEY', 'test-key')
+    client = OpenAIClient()
+
+    async def use_client():
+        async with openai_client._get_loop_resources()['semaphore']:
+            api_client = client._get_client()
+        assert client._get_client() is api_client
+        resources = openai_client._get_loop_resources()
+        await close_http_client()
+        return api_client, resources
+
+    first_client, first_resources = asyncio.run(use_client())
+    second_client, second_resources = asyncio.run(use_client())
+    assert first_client is not second_client
+    assert first_resources['semaphore'] is not second_resources['semaphore']
+    assert first_resources['http_client'].is_closed
@@ -0,0 +1,183 @@
+import sys
+import os
+import asyncio
+import time
+
+# Add src directory to Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.experts.sports import expert as sports_expert
+from src.experts.sports.expert import SportsExpert
+
+def make_expert(sources, calls=None, **config):
+    """Build a sports expert whose sources are replaced by fakes
+
+    Args:
+        sources (dict): Source name -> (delay in seconds, result)
+        calls (dict, optional): Collects how often each source was called
+
+    Returns:
+        SportsExpert: Expert with fake sources and caching disabled
+    """
+    expert = SportsExpert({'cache_enabled': False, **config})
+    calls = {} if calls is None else calls
+
+    def fake(name):
+        delay, result = sources.get(name, (0, None))
+
+        async def source(query):
+            calls[name] = calls.get(name, 0) + 1
+            await asyncio.sleep(delay)
+            return result
+        return source
+
+    expert._check_local_knowledge = fake('local')
+    expert._check_url_sources = fake('url')
+    expert._generate_ai_response = fake('ai')
+    expert._perform_web_search = fake('web')
+    return expert
+
+def first_response(expert, query='soru'):
+    """Run _first_response and return (response, elapsed seconds)"""
+    start = time.monotonic()
+    response = asyncio.run(expert._first_response(query))
+    return response, time.monotonic() - start
+
+def test_higher_priority_answer_wins_within_grace_period():
+    expert = make_expert({'local': (0.05, 'local'), 'ai': (0.01, 'ai')})
+    response, _ = first_response(expert)
+    assert response == 'local'
+
+def test_local_hit_skips_remote_sources():
+    calls = {}
+    expert = make_expert({'local': (0, 'local'), 'url': (0, 'url'), 'ai': (0, 'ai')}, calls)
+    response, _ = first_response(expert, 'Süper Lig şampiyonu kim?')
+    assert response == 'local'
+    assert 'ai' not in calls
+    assert 'url' not in calls
+
+def test_lower_priority_answer_returned_after_grace_period(monkeypatch):
+    monkeypatch.setattr(sports_expert, 'SOURCE_GRACE_PERIOD', 0.05)
+    expert = make_expert({'url': (2, 'url'), 'ai': (0.01, 'ai')})
+    response, elapsed = first_response(expert)
+    assert response == 'ai'
+    assert elapsed < 1
+
+def test_web_search_skipped_when_ai_answers():
+    calls = {}
+    expert = make_expert({'ai': (0.01, 'ai'), 'web': (0, 'web')}, calls)
+    response, _ = first_response(expert)
+    assert response == 'ai'
+    assert 'web' not in calls
+
+def test_web_search_runs_when_ai_has_no_answer():
+    calls = {}
+    expert = make_expert({'ai': (0.01, None), 'web': (0.01, 'web')}, calls)
+    response, _ = first_response(expert)
+    assert response == 'web'
+    assert calls['web'] == 1
+
+def test_web_search_hedges_slow_ai(monkeypatch):
+    monkeypatch.setattr(sports_expert, 'SOURCE_GRACE_PERIOD', 0.05)
+    expert = make_expert({'ai': (2, 'ai'), 'web': (0.01, 'web')}, web_hedge_delay=0.05)
+    response, elapsed = first_response(expert)
+    assert response == 'web'
+    assert elapsed < 1
+
+def test_no_answer_from_any_source():
+    expert = make_expert({})
+    response, _ = first_response(expert)
+    assert response is None
+
+class FakeWebSearch:
+    async def search(self, query, k=3):
+        return ['Galatasaray 1905 yılında kuruldu.']
+
+class FakeOpenAIClient:
+    def __init__(self, reply):
+        self.reply = reply
+
+    async def get_completion(self, system_prompt, user_prompt):
+        return self.reply
+
+def web_search_response(reply):
+    """Run _perform_web_search with a fixed model reply"""
+    expert = SportsExpert({'cache_enabled': False})
+    expert.web_search = FakeWebSearch()
+    expert.openai_client = FakeOpenAIClient(reply)
+    return asyncio.run(expert._perform_web_search('Galatasaray ne zaman kuruldu?'))
+
+def test_web_search_parses_fenced_json_reply():
+    reply = 'İşte yanıt:\n```json\n{"answer": "1905", "is_valid": true, "reason": "kaynakta var"}\n```'
+    assert web_search_response(reply) == '1905'
+
+def test_web_search_reply_without_json_gives_no_answer():
+    assert web_search_response('Bilmiyorum.') is None
+
+class FakeCache:
+    """In-memory stand-in for RedisCache with controllable entry ages"""
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self.entries = {}
+
+    def make_key(self, query):
+        return " ".join(query.lower().split())
+
+    async def get_with_meta(self, query):
+        return self.entries.get(self.make_key(query), (None, 0.0))
+
+    async def set(self, query, value):
+        self.entries[self.make_key(query)] = (value, 0.0)
+
+def test_stale_entry_refreshed_once_per_cache_key():
+    calls = {}
+    expert = make_expert({'ai': (0.05, 'yeni uzun bir yanıt')}, calls)
+    expert.cache = FakeCache()
+    expert.cache.entries['galatasaray ne zaman kuruldu'] = ('eski yanıt', 120.0)
+
+    async def ask_twice():
+        responses = [
+            await expert.get_response('Galatasaray ne zaman kuruldu'),
+            await expert.get_response('galatasaray  NE zaman kuruldu')
+        ]
+        await asyncio.gather(*expert._refreshing.values())
+        return responses
+
+    assert asyncio.run(ask_twice()) == ['eski yanıt', 'eski yanıt']
+    assert calls['ai'] == 1
+    assert expert.cache.entries['galatasaray ne zaman kuruldu'] == ('yeni uzun bir yanıt', 0.0)
+
+def test_find_answer_matches_common_question_keywords():
+    from src.experts.sports.sources.local_data import find_answer
+    assert find_answer("Galatasaray'ın UEFA zaferi") == "Galatasaray UEFA Kupası'nı 2000 yılında kazanmıştır."
+    assert find_answer("voleybol") is None
+
+def test_identical_concurrent_queries_share_one_run():
+    calls = {}
+    expert = make_expert({'ai': (0.05, 'ai')}, calls)
+
+    async def ask_many():
+        return await asyncio.gather(*[expert.get_response('Derbi ne zaman?') for _ in range(5)])
+
+    assert asyncio.run(ask_many()) == ['ai'] * 5
+    assert calls['ai'] == 1
+    assert expert._inflight == {}
+
+def test_cancelled_caller_does_not_cancel_shared_run():
+    calls = {}
+    expert = make_expert({'ai': (0.05, 'ai')}, calls)
+
+    async def cancel_first():
+        first = asyncio.create_task(expert.get_response('Derbi ne zaman?'))
+        second = asyncio.create_task(expert.get_response('Derbi ne zaman?'))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second, first.cancelled()
+
+    assert asyncio.run(cancel_first()) == ('ai', True)
+    assert calls['ai'] == 1
+
+def test_web_search_respects_invalid_verdict():
+    reply = '{"answer": "Fenerbahçe 1905 yılında kuruldu", "is_valid": false, "reason": "yanlış takım"}'
+    assert web_search_response(reply) is None
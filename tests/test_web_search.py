@@ -0,0 +1,33 @@
+import sys
+import os
+import asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Add src directory to Python path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.utils.web_search import get_session, close_session
+from src.experts.sports.sources.url_sources import fetch_url_content
+
+async def hello(request):
+    return web.Response(text='Süper Lig')
+
+async def fetch_from_local_server(close=True):
+    """Fetch a page from a throwaway local server through the shared session"""
+    app = web.Application()
+    app.router.add_get('/', hello)
+    async with TestServer(app) as server:
+        content = await fetch_url_content(str(server.make_url('/')))
+    session = get_session()
+    if close:
+        await close_session()
+    return content, session
+
+def test_session_works_across_event_loops():
+    # The first loop ends without closing its session, like a script would
+    first_content, first_session = asyncio.run(fetch_from_local_server(close=False))
+    second_content, second_session = asyncio.run(fetch_from_local_server())
+    assert first_content == second_content == 'Süper Lig'
+    assert first_session is not second_session
+    assert second_session.closed